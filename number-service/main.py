@@ -1,16 +1,33 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
-from typing import List, Dict, Any, Optional
-import json
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, TypeAdapter
+from typing import List, Dict, Any, Optional, Tuple
 import random
+import orjson
+from functools import lru_cache
 from pathlib import Path
+from contextlib import asynccontextmanager
 from datetime import datetime
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Parse and index the static activities file before serving requests
+    try:
+        load_activity_index()
+    except HTTPException as e:
+        # The loader reports errors for request handlers; fail startup plainly
+        raise RuntimeError(f"Cannot start number service: {e.detail}") from e
+    yield
+
+
 app = FastAPI(
     title="Ganitha Mithura - Number Service API",
     description="Backend API for Number Learning Module - Phase 1",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 # CORS middleware for Flutter app
@@ -20,6 +37,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    max_age=86400,  # Let browsers cache preflight responses for 24h
 )
 
 # Data file path
@@ -39,6 +57,10 @@ class Activity(BaseModel):
     order: int
 
 
+# Validates/serializes whole activity lists in one pydantic-core call
+ACTIVITY_LIST_ADAPTER = TypeAdapter(List[Activity])
+
+
 class ScoreSubmission(BaseModel):
     activity_id: str
     score: int
@@ -49,12 +71,12 @@ class ScoreSubmission(BaseModel):
 
 # ==================== Helper Functions ====================
 
-def load_activities() -> List[Activity]:
-    """Load activities from JSON file"""
+@lru_cache(maxsize=1)
+def load_activities() -> Tuple[Activity, ...]:
+    """Load activities from JSON file (parsed once per process)"""
     try:
-        with open(ACTIVITIES_FILE, 'r') as f:
-            data = json.load(f)
-            return [Activity(**activity) for activity in data['activities']]
+        data = orjson.loads(ACTIVITIES_FILE.read_bytes())
+        return tuple(ACTIVITY_LIST_ADAPTER.validate_python(data['activities']))
     except FileNotFoundError:
         raise HTTPException(
             status_code=500,
@@ -67,6 +89,64 @@ def load_activities() -> List[Activity]:
         )
 
 
+@lru_cache(maxsize=1)
+def load_activity_index() -> Dict[str, Dict]:
+    """
+    Group serialized activities for the endpoints (built once per process).
+
+    The returned lists are shared between requests; treat them as read-only.
+    """
+    by_level: Dict[int, List[Dict[str, Any]]] = {}
+    by_level_number: Dict[Tuple[int, int], List[Dict[str, Any]]] = {}
+    testable_by_level: Dict[int, List[Dict[str, Any]]] = {}
+
+    activities = load_activities()
+    for activity, data in zip(activities, ACTIVITY_LIST_ADAPTER.dump_python(list(activities))):
+        by_level.setdefault(activity.level, []).append(data)
+        by_level_number.setdefault((activity.level, activity.number), []).append(data)
+        # Video lessons are excluded from tests
+        if activity.type != 'video':
+            testable_by_level.setdefault(activity.level, []).append(data)
+
+    # Learning flow order within each number
+    for number_activities in by_level_number.values():
+        number_activities.sort(key=lambda a: a['order'])
+
+    return {
+        "by_level": by_level,
+        "by_level_number": by_level_number,
+        "testable_by_level": testable_by_level,
+    }
+
+
+def render_json(payload: Dict[str, Any]) -> Response:
+    """Encode a payload of plain JSON types directly, skipping jsonable_encoder"""
+    return Response(content=orjson.dumps(payload), media_type="application/json")
+
+
+@lru_cache(maxsize=None)
+def render_level_activities(level: int) -> bytes:
+    """Encoded /levels/{level}/activities body (static per level)"""
+    level_activities = load_activity_index()["by_level"].get(level, [])
+    return orjson.dumps({
+        "level": level,
+        "count": len(level_activities),
+        "activities": level_activities
+    })
+
+
+@lru_cache(maxsize=None)
+def render_number_activities(level: int, number: int) -> bytes:
+    """Encoded /activities/number/{number} body (static per level and number)"""
+    number_activities = load_activity_index()["by_level_number"].get((level, number), [])
+    return orjson.dumps({
+        "level": level,
+        "number": number,
+        "count": len(number_activities),
+        "activities": number_activities
+    })
+
+
 # ==================== Endpoints ====================
 
 @app.get("/")
@@ -103,16 +183,7 @@ async def get_activities_for_level(level: int):
             detail=f"Level {level} not yet implemented. Only Level 1 is available in Phase 1."
         )
     
-    activities = load_activities()
-    
-    # Filter by level
-    level_activities = [a for a in activities if a.level == level]
-    
-    return {
-        "level": level,
-        "count": len(level_activities),
-        "activities": [a.dict() for a in level_activities]
-    }
+    return Response(content=render_level_activities(level), media_type="application/json")
 
 
 @app.post("/activity/score")
@@ -142,13 +213,8 @@ async def get_beginner_test():
     Activities are randomly selected and shuffled each time.
     Excludes video lessons.
     """
-    activities = load_activities()
-    
-    # Filter Level 1 activities, exclude videos
-    testable_activities = [
-        a for a in activities 
-        if a.level == 1 and a.type != 'video'
-    ]
+    # Level 1 activities, excluding videos
+    testable_activities = load_activity_index()["testable_by_level"].get(1, [])
     
     if len(testable_activities) < 5:
         raise HTTPException(
@@ -159,11 +225,11 @@ async def get_beginner_test():
     # Randomly select 5 activities
     test_activities = random.sample(testable_activities, 5)
     
-    return {
+    return render_json({
         "test_type": "beginner",
         "count": len(test_activities),
-        "activities": [a.dict() for a in test_activities]
-    }
+        "activities": test_activities
+    })
 
 
 @app.get("/activities/number/{number}")
@@ -186,23 +252,8 @@ async def get_activities_for_number(number: int, level: int = 1):
             detail="Number must be between 1 and 10 for Level 1"
         )
     
-    activities = load_activities()
-    
-    # Filter by level and number
-    number_activities = [
-        a for a in activities 
-        if a.level == level and a.number == number
-    ]
-    
-    # Sort by order
-    number_activities.sort(key=lambda x: x.order)
-    
-    return {
-        "level": level,
-        "number": number,
-        "count": len(number_activities),
-        "activities": [a.dict() for a in number_activities]
-    }
+    # Activities for this number, sorted by order
+    return Response(content=render_number_activities(level, number), media_type="application/json")
 
 
 # TODO: Phase 2 - Additional endpoints
@@ -0,0 +1,4 @@
+import os
+
+# Largest request body or URL download accepted for shape detection
+MAX_UPLOAD_BYTES = int(os.getenv("MAX_UPLOAD_BYTES", str(10 * 1024 * 1024)))
@@ -1,9 +1,21 @@
+import os
+import time
 from database.database import get_database
 from fastapi import HTTPException
 
+# Fields returned to clients for each shape
+SHAPE_FIELDS = {"_id": 1, "id": 1, "name": 1, "description": 1, "image_url": 1}
+# Shapes are reference data; serve repeat reads from memory for this long.
+# Nothing in this service writes shapes, so changes made directly in the
+# database become visible per worker within this many seconds.
+SHAPES_CACHE_TTL = float(os.getenv("SHAPES_CACHE_TTL", "300"))
+
+
 class ShapesController:
     def __init__(self):
         self.db = get_database()
+        self._shapes_cache = None  # (expires_at, shapes)
+        self._image_cache = {}  # image_id -> (expires_at, data)
     
     
     async def get_shapes(self):
@@ -16,14 +28,17 @@ class ShapesController:
         Raises:
             HTTPException: If no shapes are found in the database.
         """
-        shapes = []
-        cursor = self.db.shapes.find({})
-        async for document in cursor:
+        now = time.monotonic()
+        if self._shapes_cache and self._shapes_cache[0] > now:
+            return self._shapes_cache[1]
+
+        shapes = await self.db.shapes.find({}, projection=SHAPE_FIELDS).to_list(length=None)
+        for document in shapes:
             document['_id'] = str(document['_id'])
-            shapes.append(document)
         
         if not shapes:
             raise HTTPException(status_code=404, detail="No shapes found")
+        self._shapes_cache = (now + SHAPES_CACHE_TTL, shapes)
         return shapes
     
     async def get_image_by_id(self, image_id: str):
@@ -39,6 +54,11 @@ class ShapesController:
         Raises:
             HTTPException: If no shape with the given ID is found in the database.
         """
+        now = time.monotonic()
+        cached = self._image_cache.get(image_id)
+        if cached and cached[0] > now:
+            return cached[1]
+
         shape = await self.db.shapes.find_one({"id": image_id})
         if shape:
             data = {
@@ -47,6 +67,8 @@ class ShapesController:
                 "description": shape["description"],
                 "image_url": shape["image_url"],
             }
+            # Only found shapes are cached, so unknown ids cannot grow the cache
+            self._image_cache[image_id] = (now + SHAPES_CACHE_TTL, data)
             return data
         raise HTTPException(status_code=404, detail="Shape not found")
 
@@ -1,7 +1,6 @@
 # python
 from fastapi import HTTPException, UploadFile, File, Request
-from fastapi.concurrency import run_in_threadpool
-from app.services.shape_predict import get_shape_from_image
+from app.services.shape_predict import get_shape_from_image_batched, ImageTooLargeError
 
 class ShapesDetectionController:
     def __init__(self):
@@ -16,6 +15,8 @@ class ShapesDetectionController:
         Raises:
             HTTPException: 
                 - 400: If no image is provided as a file or URL.
+                - 413: If the image at the given URL exceeds MAX_UPLOAD_BYTES
+                  (oversized request bodies are rejected by MaxBodySizeMiddleware).
                 - 500: For any internal server errors during shape detection.
 
         Returns:
@@ -28,13 +29,15 @@ class ShapesDetectionController:
                 image_url = payload.get("image_url")
                 if not image_url:
                     raise HTTPException(status_code=400, detail="400: No image provided as a file or a URL")
-                shape = await run_in_threadpool(get_shape_from_image, str(image_url))
+                shape = await get_shape_from_image_batched(str(image_url))
             elif image_file:
-                shape = await run_in_threadpool(get_shape_from_image, image_file.file)
+                shape = await get_shape_from_image_batched(image_file.file)
             else:
                 raise HTTPException(status_code=400, detail="400: No image provided as a file or a URL")
             return {"shape": shape}
         except HTTPException:
             raise
+        except ImageTooLargeError:
+            raise HTTPException(status_code=413, detail="413: Image too large")
         except Exception as e:
             raise HTTPException(status_code=500, detail=str(e))
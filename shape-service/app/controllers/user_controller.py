@@ -1,6 +1,8 @@
 from database.database import get_database
 from fastapi import HTTPException, Depends
 from fastapi.security import OAuth2PasswordRequestForm
+from fastapi.concurrency import run_in_threadpool
+from pymongo.errors import DuplicateKeyError
 from app.services.auth_service import create_access_token, verify_password, get_password_hash
 from datetime import timedelta
 from app.models.model import UserCreate
@@ -24,8 +26,11 @@ class UserController:
         Returns:
             A dictionary containing the access token and token type ("bearer").
         """
-        user = await self.users_collection.find_one({"user_name": form_data.username})
-        if not user or not verify_password(form_data.password, user["password"]):
+        user = await self.users_collection.find_one(
+            {"user_name": form_data.username}, {"user_name": 1, "password": 1}
+        )
+        # argon2 is CPU-bound; keep it off the event loop
+        if not user or not await run_in_threadpool(verify_password, form_data.password, user["password"]):
             raise HTTPException(
                 status_code=401,
                 detail="Incorrect username or password",
@@ -50,15 +55,20 @@ class UserController:
         Returns:
             A confirmation message indicating successful user creation.
         """
-        user = await self.users_collection.find_one({"user_name": user_data.username})
+        # Cheap check first so a taken name does not cost an argon2 hash
+        user = await self.users_collection.find_one({"user_name": user_data.username}, {"_id": 1})
         if user:
             raise HTTPException(status_code=400, detail="Username already registered")
 
-        hashed_password = get_password_hash(user_data.password)
+        hashed_password = await run_in_threadpool(get_password_hash, user_data.password)
         new_user = {
             "user_name": user_data.username,
             "password": hashed_password,
             "game_status": "not_attempt",
         }
-        await self.users_collection.insert_one(new_user)
+        try:
+            await self.users_collection.insert_one(new_user)
+        except DuplicateKeyError:
+            # A concurrent registration won the race; the unique index rejected this one
+            raise HTTPException(status_code=400, detail="Username already registered")
         return {"message": "User created successfully"}
@@ -1,12 +1,97 @@
-from fastapi import FastAPI
+import logging
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, HTTPException
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse
 from app.endpoints import endpoints
 from fastapi.middleware.cors import CORSMiddleware
+from database.database import get_database
+from app.constants.constants import MAX_UPLOAD_BYTES
+from app.services.shape_predict import prepare_model, warmup
+from pymongo.errors import OperationFailure, PyMongoError
 
-app = FastAPI(title="Shape Patterns Backend")
+logger = logging.getLogger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Open the Mongo connection pool before the first request needs it. This is
+    # best-effort: shape detection does not use Mongo, so start without it
+    db = get_database()
+    try:
+        await db.command("ping")
+    except PyMongoError as e:
+        logger.warning("MongoDB unreachable at startup, skipping pool warm-up and index setup: %s", e)
+    else:
+        # get_image_by_id looks shapes up by their "id" field
+        await db.shapes.create_index("id")
+        # login, register and get_current_user look users up by name, and the
+        # unique index stops concurrent registrations of the same name
+        try:
+            await db.users.create_index("user_name", unique=True)
+        except OperationFailure as e:
+            raise RuntimeError(
+                "Cannot create the unique users.user_name index; resolve duplicate user "
+                f"names with scripts/dedupe_user_names.py first: {e}"
+            ) from e
+    # Device setup happens here, after any gunicorn fork
+    prepare_model()
+    # Warm the shape model so the first /detect-shape/ call is not slow
+    await run_in_threadpool(warmup)
+    yield
+
+
+class MaxBodySizeMiddleware:
+    """
+    Rejects request bodies larger than max_body_size with a 413.
+
+    The declared content-length is checked up front, and the body is counted
+    as it streams in, so chunked uploads are stopped before they are fully
+    buffered.
+    """
+
+    def __init__(self, app, max_body_size: int):
+        self.app = app
+        self.max_body_size = max_body_size
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        content_length = dict(scope["headers"]).get(b"content-length", b"")
+        if content_length.isdigit() and int(content_length) > self.max_body_size:
+            response = ORJSONResponse({"detail": "413: Image too large"}, status_code=413)
+            await response(scope, receive, send)
+            return
+
+        received = 0
+
+        async def limited_receive():
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_body_size:
+                    # FastAPI re-raises HTTPExceptions from body parsing as-is
+                    raise HTTPException(status_code=413, detail="413: Image too large")
+            return message
+
+        await self.app(scope, limited_receive, send)
+
+
+app = FastAPI(
+    title="Shape Patterns Backend",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+)
+
+# Added before CORS so CORS wraps it and 413 responses keep CORS headers
+app.add_middleware(MaxBodySizeMiddleware, max_body_size=MAX_UPLOAD_BYTES)
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"]
+    allow_origins=["*"],
+    max_age=86400,  # Let browsers cache preflight responses for 24h
 )
 
 app.include_router(endpoints.router, prefix="/shapes-patterns")
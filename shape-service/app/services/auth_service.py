@@ -1,10 +1,13 @@
+import hashlib
 import os
+import time
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from jose import JWTError, jwt
+import jwt
+from jwt import InvalidTokenError
 from passlib.context import CryptContext
 
 from database.database import get_database
@@ -15,7 +18,14 @@ if not SECRET_KEY:
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 120
 
+# Verified tokens are reused for a short time to skip decode + user lookup
+TOKEN_CACHE_TTL = 30
+TOKEN_CACHE_MAX_SIZE = 10000
+_token_cache = {}  # sha256(token) -> (expires_at, user)
+
 pwd_context = CryptContext(schemes=["argon2"], deprecated="auto")
+# Load the argon2 backend now rather than on the first login
+pwd_context.hash("warmup")
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/shapes-patterns/token")
 
 
@@ -81,6 +91,11 @@ async def get_current_user(token: str = Depends(oauth2_scheme)):
     Returns:
         The user document from the database corresponding to the token's subject.
     """
+    token_key = hashlib.sha256(token.encode()).digest()
+    cached = _token_cache.get(token_key)
+    if cached and cached[0] > time.monotonic():
+        return cached[1]
+
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -91,10 +106,17 @@ async def get_current_user(token: str = Depends(oauth2_scheme)):
         user_id: str = payload.get("sub")
         if user_id is None:
             raise credentials_exception
-    except JWTError:
+    except InvalidTokenError:
         raise credentials_exception
     db = get_database()
     user = await db["users"].find_one({"user_name": user_id})
     if user is None:
         raise credentials_exception
+
+    # Never cache past the token's own expiry
+    ttl = min(TOKEN_CACHE_TTL, payload.get("exp", 0) - time.time())
+    if ttl > 0:
+        if len(_token_cache) >= TOKEN_CACHE_MAX_SIZE:
+            _token_cache.pop(next(iter(_token_cache)))
+        _token_cache[token_key] = (time.monotonic() + ttl, user)
     return user
@@ -1,47 +1,325 @@
+import asyncio
+import io
+import os
 import numpy as np
+import torch
 from PIL import Image
 from transformers import AutoImageProcessor, AutoModelForImageClassification
+from fastapi.concurrency import run_in_threadpool
 import requests
 
-feature_extractor = AutoImageProcessor.from_pretrained('0-ma/mobilenet-v2-geometric-shapes')
-model = AutoModelForImageClassification.from_pretrained('0-ma/mobilenet-v2-geometric-shapes')
+from app.constants.constants import MAX_UPLOAD_BYTES
 
-def get_shape_from_image(image_input):
+try:
+    # Optional libjpeg-turbo bindings for faster JPEG decoding
+    from turbojpeg import TurboJPEG, TJPF_RGB
+    turbo_jpeg = TurboJPEG()
+except (ImportError, RuntimeError):
+    turbo_jpeg = None
+
+MODEL_NAME = '0-ma/mobilenet-v2-geometric-shapes'
+# Optional ONNX export of the model (see export_onnx); used instead of torch when set
+ONNX_MODEL_PATH = os.getenv("SHAPE_MODEL_ONNX")
+# Concurrent requests are coalesced into one forward pass of up to this many images
+BATCH_MAX_SIZE = int(os.getenv("SHAPE_BATCH_MAX_SIZE", "8"))
+BATCH_WAIT_SECONDS = float(os.getenv("SHAPE_BATCH_WAIT_MS", "5")) / 1000
+
+feature_extractor = AutoImageProcessor.from_pretrained(MODEL_NAME)
+# CPU until prepare_model() runs in the serving process (see below)
+device = "cpu"
+ort_session = None
+model = None
+
+if not ONNX_MODEL_PATH:
+    # Weights load on CPU at import so a preloading gunicorn master shares them
+    model = AutoModelForImageClassification.from_pretrained(MODEL_NAME)
+    model.eval()
+
+# Smallest side to decode large images at (MobileNet-V2 preprocessing resizes to 256)
+DECODE_MIN_SIDE = 256
+
+LABELS = (
+    "None",
+    "Circle",
+    "Triangle",
+    "Square",
+    "Pentagon",
+    "Hexagon",
+)
+
+class ImageTooLargeError(ValueError):
+    """Raised when an image download exceeds MAX_UPLOAD_BYTES."""
+
+
+def load_image(image_input):
     """
-    Identifies the geometric shape in an image using a pre-trained model.
+    Opens the input image.
+
+    JPEGs are decoded at a reduced scale when they are much larger than the
+    model input; the shorter side is kept at or above DECODE_MIN_SIDE so the
+    processor's resize sees the same detail.
 
     Args:
         image_input: The input image, which can be a string (URL) or a
                      file-like object (e.g., from an uploaded file).
 
     Returns:
-        A string representing the predicted shape label (e.g., "Circle", "Square").
+        A PIL image.
+
+    Raises:
+        ImageTooLargeError: If a URL download exceeds MAX_UPLOAD_BYTES.
     """
-    labels = [
-        "None",
-        "Circle",
-        "Triangle",
-        "Square",
-        "Pentagon",
-        "Hexagon"
-    ]
-    
     if isinstance(image_input, str):
-        # Assume it's a URL
+        # Assume it's a URL; stop downloading as soon as the limit is passed
         try:
-            response = requests.get(image_input, stream=True, timeout=10)
-            response.raise_for_status()  # Raise an exception for HTTP errors
-            image = Image.open(response.raw)
+            with requests.get(image_input, stream=True, timeout=10) as response:
+                response.raise_for_status()  # Raise an exception for HTTP errors
+                data = bytearray()
+                for chunk in response.iter_content(chunk_size=64 * 1024):
+                    data += chunk
+                    if len(data) > MAX_UPLOAD_BYTES:
+                        raise ImageTooLargeError("Image at URL is too large")
+            image_input = io.BytesIO(data)
         except requests.exceptions.RequestException as e:
             raise ValueError(f"Could not retrieve image from URL: {e}")
-    else:
-        # Assume it's a file-like object
-        image = Image.open(image_input)
-    
-    inputs = feature_extractor(images=image, return_tensors="pt")
-    logits = model(**inputs)['logits'].cpu().detach().numpy()
-    
-    prediction = np.argmax(logits, axis=1)[0]
-    predicted_label = labels[prediction]
-    
-    return predicted_label
+    # Otherwise assume it's a file-like object
+
+    if turbo_jpeg is not None:
+        data = image_input.read()
+        if data[:2] == b"\xff\xd8":
+            try:
+                return decode_jpeg_turbo(data)
+            except Exception:
+                # Leave corrupt or unusual JPEGs to PIL below
+                pass
+        image_input = io.BytesIO(data)
+
+    image = Image.open(image_input)
+    # Only affects JPEG (DCT scaling); a no-op for other formats
+    image.draft("RGB", (DECODE_MIN_SIDE, DECODE_MIN_SIDE))
+    return image
+
+
+def decode_jpeg_turbo(data):
+    """
+    Decodes JPEG bytes with libjpeg-turbo, using the strongest DCT scaling
+    that keeps the shorter side at or above DECODE_MIN_SIDE.
+
+    Args:
+        data: The JPEG file contents.
+
+    Returns:
+        A PIL image in RGB mode.
+    """
+    width, height, _, _ = turbo_jpeg.decode_header(data)
+    short_side = min(width, height)
+    scaling_factor = min(
+        (factor for factor in turbo_jpeg.scaling_factors
+         if factor[0] <= factor[1] and short_side * factor[0] // factor[1] >= DECODE_MIN_SIDE),
+        key=lambda factor: factor[0] / factor[1],
+        default=None,
+    )
+    rgb = turbo_jpeg.decode(data, pixel_format=TJPF_RGB, scaling_factor=scaling_factor)
+    return Image.fromarray(rgb)
+
+
+def preprocess(image):
+    """
+    Converts a PIL image into model input.
+
+    Returns:
+        A float32 numpy array of pixel values with shape (1, 3, H, W).
+    """
+    return feature_extractor(images=image, return_tensors="np")["pixel_values"]
+
+
+def forward(pixel_values):
+    """
+    Runs the shape model on a batch of preprocessed images.
+
+    Args:
+        pixel_values: A numpy array with shape (N, 3, H, W).
+
+    Returns:
+        A numpy array of logits with shape (N, num_labels).
+    """
+    if ort_session is not None:
+        return ort_session.run(["logits"], {"pixel_values": pixel_values})[0]
+
+    # Inference only: skip autograd bookkeeping for the forward pass
+    with torch.inference_mode():
+        return model(pixel_values=torch.from_numpy(pixel_values).to(device))['logits'].cpu().numpy()
+
+
+def predict_logits(image):
+    """
+    Runs the shape model on a PIL image.
+
+    Args:
+        image: The decoded input image.
+
+    Returns:
+        A numpy array of logits with shape (1, num_labels).
+    """
+    return forward(preprocess(image))
+
+
+class InferenceBatcher:
+    """
+    Coalesces concurrent inference requests into batched forward passes.
+
+    A lone request runs immediately. When others are already queued, a short
+    collection window opens and everything that arrives within it (up to
+    max_batch_size) runs as one batch in a worker thread. Requests that queue
+    up during a forward pass are picked up together by the next one.
+    """
+
+    def __init__(self, max_batch_size=BATCH_MAX_SIZE, max_wait=BATCH_WAIT_SECONDS):
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self._loop = None
+        self._queue = None
+        self._task = None
+
+    async def submit(self, pixel_values):
+        """
+        Queues one preprocessed image and waits for its logits.
+
+        Args:
+            pixel_values: A numpy array with shape (1, 3, H, W).
+
+        Returns:
+            A numpy array of logits with shape (1, num_labels).
+        """
+        loop = asyncio.get_running_loop()
+        # Start the worker lazily, and again if the event loop changed
+        if self._loop is not loop or self._task.done():
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._task = loop.create_task(self._run())
+        future = loop.create_future()
+        await self._queue.put((pixel_values, future))
+        return await future
+
+    async def _run(self):
+        while True:
+            items = [await self._queue.get()]
+            # Only hold the window open when other requests are already queued
+            if not self._queue.empty():
+                await asyncio.sleep(self.max_wait)
+            while len(items) < self.max_batch_size and not self._queue.empty():
+                items.append(self._queue.get_nowait())
+
+            try:
+                logits = await run_in_threadpool(forward, np.concatenate([p for p, _ in items]))
+            except Exception as e:
+                for _, future in items:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            for i, (_, future) in enumerate(items):
+                if not future.done():
+                    future.set_result(logits[i:i + 1])
+
+
+batcher = InferenceBatcher()
+
+
+async def get_shape_from_image_batched(image_input):
+    """
+    Identifies the geometric shape in an image, sharing forward passes with
+    concurrent requests.
+
+    Args:
+        image_input: The input image, which can be a string (URL) or a
+                     file-like object (e.g., from an uploaded file).
+
+    Returns:
+        A string representing the predicted shape label (e.g., "Circle", "Square").
+    """
+    # Decode and preprocess off the event loop, per request
+    pixel_values = await run_in_threadpool(lambda: preprocess(load_image(image_input)))
+    logits = await batcher.submit(pixel_values)
+    return LABELS[int(np.argmax(logits, axis=1)[0])]
+
+
+def prepare_model():
+    """
+    Creates the ONNX Runtime session, or picks the inference device for the
+    torch model.
+
+    Must run in the process that serves requests (the app lifespan), not at
+    import: with gunicorn's preload_app the import happens in the master, and
+    neither CUDA nor ONNX Runtime's thread pools survive a fork.
+    """
+    global device, ort_session
+    if ONNX_MODEL_PATH:
+        import onnxruntime as ort
+
+        sess_options = ort.SessionOptions()
+        sess_options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        # Same per-worker core share as torch (set in gunicorn's post_fork)
+        sess_options.intra_op_num_threads = torch.get_num_threads()
+        ort_session = ort.InferenceSession(
+            ONNX_MODEL_PATH, sess_options=sess_options, providers=["CPUExecutionProvider"]
+        )
+        if ort_session.get_modelmeta().custom_metadata_map.get("quantization") == "dynamic-int8":
+            # Dynamic int8 picks one activation scale per input tensor, so a
+            # batched image's result would depend on its batch-mates
+            batcher.max_batch_size = 1
+        return
+    device = "cuda" if torch.cuda.is_available() else "cpu"
+    model.to(device)
+
+
+def warmup():
+    """
+    Runs one forward pass on a blank image so the first real request does
+    not pay for lazy operator and allocator initialization.
+    """
+    predict_logits(Image.new("RGB", (224, 224)))
+
+
+def export_onnx(path):
+    """
+    Exports the fp32 shape model to ONNX for use with SHAPE_MODEL_ONNX.
+
+    Args:
+        path: Destination file for the exported model.
+    """
+    export_model = AutoModelForImageClassification.from_pretrained(MODEL_NAME)
+    export_model.eval()
+    inputs = feature_extractor(images=Image.new("RGB", (224, 224)), return_tensors="pt")
+    torch.onnx.export(
+        export_model,
+        (inputs["pixel_values"],),
+        path,
+        input_names=["pixel_values"],
+        output_names=["logits"],
+        # Variable batch size so batched requests can share a session run
+        dynamic_axes={"pixel_values": {0: "batch"}, "logits": {0: "batch"}},
+        opset_version=17,
+    )
+
+
+def quantize_onnx(src, dst):
+    """
+    Writes an int8 copy of an exported model (see export_onnx), for use with
+    SHAPE_MODEL_ONNX.
+
+    Uses ONNX Runtime dynamic quantization, which covers the convolutions as
+    well as the classifier. The model is tagged so prepare_model() can turn
+    off request batching for it.
+
+    Args:
+        src: The fp32 model written by export_onnx.
+        dst: Destination file for the quantized model.
+    """
+    import onnx
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+
+    quantize_dynamic(src, dst, weight_type=QuantType.QInt8)
+    quantized = onnx.load(dst)
+    onnx.helper.set_model_props(quantized, {"quantization": "dynamic-int8"})
+    onnx.save(quantized, dst)
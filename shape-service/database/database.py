@@ -1,6 +1,6 @@
 import os
 from dotenv import load_dotenv
-from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import AsyncMongoClient
 
 load_dotenv()
 
@@ -12,7 +12,16 @@ if not MONGODB_URL:
 if not DB_NAME:
     raise ValueError("DB_NAME environment variable is required")
 
-client = AsyncIOMotorClient(MONGODB_URL)
+# Pool limits are per process: total connections scale with the number of
+# gunicorn workers (WEB_CONCURRENCY), so keep the per-worker defaults small.
+client = AsyncMongoClient(
+    MONGODB_URL,
+    maxPoolSize=int(os.getenv("MONGODB_MAX_POOL_SIZE", "20")),
+    minPoolSize=int(os.getenv("MONGODB_MIN_POOL_SIZE", "1")),
+    maxIdleTimeMS=30000,
+    serverSelectionTimeoutMS=2000,
+    socketTimeoutMS=5000,
+)
 database = client[DB_NAME]
 
 def get_database():
@@ -0,0 +1,22 @@
+"""Gunicorn settings for serving the Shape Patterns Backend in production."""
+
+import multiprocessing
+import os
+
+bind = os.getenv("BIND", "0.0.0.0:8000")
+
+# Import app.main once in the master so the shape classifier weights are
+# loaded a single time and shared copy-on-write by every forked worker.
+preload_app = True
+
+# Inference is CPU-bound and every worker runs its own torch thread pool,
+# request batcher and Mongo pool, so default to one worker per core.
+workers = int(os.getenv("WEB_CONCURRENCY", multiprocessing.cpu_count()))
+worker_class = "uvicorn_worker.UvicornWorker"
+
+
+def post_fork(server, worker):
+    # Split the cores between workers so threads x workers ~= cores
+    import torch
+
+    torch.set_num_threads(max(1, multiprocessing.cpu_count() // workers))
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+One-off migration: resolve duplicate user names before the unique index.
+
+The service creates a unique index on users.user_name at startup and refuses
+to start while duplicates exist. This script lists every duplicated user_name
+and, with --apply, keeps the oldest document for each one and deletes the
+rest. It also drops an older non-unique user_name index so the next startup
+can build the unique one.
+
+Review the dry-run output (and back up the users collection) before running
+with --apply.
+"""
+
+import argparse
+import logging
+import os
+
+from dotenv import load_dotenv
+from pymongo import MongoClient
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+def find_duplicates(users):
+    """
+    Groups user documents by user_name.
+
+    Args:
+        users: The users collection.
+
+    Returns:
+        A list of (user_name, ids) pairs for names used more than once, with
+        ids ordered oldest first.
+    """
+    groups = users.aggregate([
+        {"$sort": {"_id": 1}},
+        {"$group": {"_id": "$user_name", "ids": {"$push": "$_id"}, "count": {"$sum": 1}}},
+        {"$match": {"count": {"$gt": 1}}},
+    ])
+    return [(group["_id"], group["ids"]) for group in groups]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Remove duplicate user names from the users collection")
+    parser.add_argument("--apply", action="store_true",
+                        help="Delete the duplicates (default is a dry run)")
+    args = parser.parse_args()
+
+    load_dotenv()
+    client = MongoClient(os.environ["MONGODB_URL"])
+    users = client[os.environ["DB_NAME"]].users
+
+    duplicates = find_duplicates(users)
+    for user_name, ids in duplicates:
+        logger.info("%r: keeping %s, removing %s", user_name, ids[0], ", ".join(map(str, ids[1:])))
+    if not duplicates:
+        logger.info("No duplicate user names found")
+
+    indexes = users.index_information()
+    stale_index = "user_name_1" in indexes and not indexes["user_name_1"].get("unique")
+    if stale_index:
+        logger.info("Non-unique index user_name_1 will be dropped")
+
+    if not args.apply:
+        logger.info("Dry run; re-run with --apply to make these changes")
+        return
+
+    for user_name, ids in duplicates:
+        result = users.delete_many({"_id": {"$in": ids[1:]}})
+        logger.info("%r: removed %d documents", user_name, result.deleted_count)
+    if stale_index:
+        users.drop_index("user_name_1")
+        logger.info("Dropped index user_name_1")
+
+
+if __name__ == "__main__":
+    main()
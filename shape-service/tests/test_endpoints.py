@@ -1,5 +1,7 @@
 from fastapi.testclient import TestClient
 from app.main import app
+from app.constants.constants import MAX_UPLOAD_BYTES
+from app.services import shape_predict
 
 client = TestClient(app)
 
@@ -8,3 +10,60 @@ def test_detect_shape():
         response = client.post("/shapes-patterns/detect-shape/", files={"image_file": ("test_image.png", f, "image/png")})
     assert response.status_code == 200
     assert "shape" in response.json()
+
+
+def test_detect_shape_rejects_oversized_content_length():
+    response = client.post(
+        "/shapes-patterns/detect-shape/",
+        files={"image_file": ("big.png", b"\0" * (MAX_UPLOAD_BYTES + 1), "image/png")},
+        headers={"Origin": "http://example.com"},
+    )
+    assert response.status_code == 413
+    assert response.headers["access-control-allow-origin"] == "*"
+
+
+def test_detect_shape_rejects_oversized_chunked_body():
+    def body():
+        # No content-length is sent for a generator body, so the limit is hit mid-stream
+        yield (
+            b"--limit\r\n"
+            b'Content-Disposition: form-data; name="image_file"; filename="big.png"\r\n'
+            b"Content-Type: image/png\r\n\r\n"
+        )
+        chunk = b"\0" * (1024 * 1024)
+        for _ in range(MAX_UPLOAD_BYTES // len(chunk) + 2):
+            yield chunk
+        yield b"\r\n--limit--\r\n"
+
+    response = client.post(
+        "/shapes-patterns/detect-shape/",
+        content=body(),
+        headers={"Content-Type": "multipart/form-data; boundary=limit", "Origin": "http://example.com"},
+    )
+    assert response.status_code == 413
+    assert response.headers["access-control-allow-origin"] == "*"
+
+
+def test_detect_shape_rejects_oversized_url_download(monkeypatch):
+    class FakeResponse:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def raise_for_status(self):
+            pass
+
+        def iter_content(self, chunk_size):
+            while True:
+                yield b"\0" * chunk_size
+
+    monkeypatch.setattr(shape_predict.requests, "get", lambda *args, **kwargs: FakeResponse())
+    response = client.post(
+        "/shapes-patterns/detect-shape/",
+        json={"image_url": "http://example.com/big.png"},
+        headers={"Origin": "http://example.com"},
+    )
+    assert response.status_code == 413
+    assert response.headers["access-control-allow-origin"] == "*"
@@ -0,0 +1,68 @@
+import asyncio
+import time
+
+import numpy as np
+
+from app.services import shape_predict
+from app.services.shape_predict import InferenceBatcher
+
+
+def row(value):
+    return np.full((1, 3, 2, 2), value, dtype=np.float32)
+
+
+def test_batcher_returns_each_request_its_own_logits(monkeypatch):
+    batch_sizes = []
+
+    def fake_forward(pixel_values):
+        batch_sizes.append(len(pixel_values))
+        return pixel_values.reshape(len(pixel_values), -1)[:, :1] * 10
+
+    monkeypatch.setattr(shape_predict, "forward", fake_forward)
+    batcher = InferenceBatcher(max_batch_size=8, max_wait=0.05)
+
+    async def run():
+        return await asyncio.gather(*(batcher.submit(row(i)) for i in range(5)))
+
+    results = asyncio.run(run())
+    assert [result.tolist() for result in results] == [[[i * 10.0]] for i in range(5)]
+    assert sum(batch_sizes) == 5
+    assert len(batch_sizes) < 5
+
+
+def test_batcher_passes_forward_errors_to_every_waiter(monkeypatch):
+    calls = []
+
+    def fake_forward(pixel_values):
+        calls.append(len(pixel_values))
+        if len(calls) == 1:
+            raise RuntimeError("forward failed")
+        return pixel_values.reshape(len(pixel_values), -1)[:, :1]
+
+    monkeypatch.setattr(shape_predict, "forward", fake_forward)
+    batcher = InferenceBatcher(max_batch_size=8, max_wait=0.05)
+
+    async def run():
+        failed = await asyncio.gather(*(batcher.submit(row(i)) for i in range(3)), return_exceptions=True)
+        # The worker keeps serving after a failed batch
+        recovered = await batcher.submit(row(7))
+        return failed, recovered
+
+    failed, recovered = asyncio.run(run())
+    assert calls[0] == 3
+    assert all(isinstance(error, RuntimeError) for error in failed)
+    assert recovered.tolist() == [[7.0]]
+
+
+def test_batcher_runs_lone_request_without_waiting(monkeypatch):
+    monkeypatch.setattr(shape_predict, "forward", lambda pixel_values: pixel_values[:, 0, 0, :1])
+    batcher = InferenceBatcher(max_batch_size=8, max_wait=5)
+
+    async def run():
+        start = time.perf_counter()
+        result = await batcher.submit(row(1))
+        return result, time.perf_counter() - start
+
+    result, elapsed = asyncio.run(run())
+    assert result.tolist() == [[1.0]]
+    assert elapsed < 1
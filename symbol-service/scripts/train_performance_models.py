@@ -8,6 +8,7 @@ This script trains all performance prediction models and saves them to disk.
 import sys
 import os
 import argparse
+import time
 from datetime import datetime
 
 # Add src to Python path
@@ -156,11 +157,9 @@ def train_models(data_path=None, output_dir='models/performance_metrics',
     logger.info("TRAINING MODELS")
     logger.info("=" * 80)
 
-    start_time = datetime.now()
+    start_time = time.perf_counter()
     predictor.train(training_data)
-    end_time = datetime.now()
-
-    training_duration = (end_time - start_time).total_seconds()
+    training_duration = time.perf_counter() - start_time
     logger.info(f"\n✅ Training completed in {training_duration:.2f} seconds")
 
     # Step 8: Evaluate models
@@ -10,6 +10,7 @@ import json
 import os
 import re
 import sys
+import threading
 from typing import Dict, List
 from openai import OpenAI
 
@@ -27,6 +28,7 @@ class AIQuestionGenerator:
     TEMPERATURE = 0.7
     MAX_TOKENS = 200
     _client = None
+    _client_lock = threading.Lock()
     _recent_questions = []  # Track all recent questions to avoid duplicates
     _max_recent = 50  # Increased from 20 to be more aggressive about preventing duplicates
     _operation_sequence = {}  # Track operation sequence per profile for variety
@@ -35,10 +37,12 @@ class AIQuestionGenerator:
     def _get_client():
         """Get or initialize OpenAI client lazily."""
         if AIQuestionGenerator._client is None:
-            api_key = os.getenv('OPENAI_API_KEY')
-            if not api_key:
-                raise ValueError("OPENAI_API_KEY environment variable is not set")
-            AIQuestionGenerator._client = OpenAI(api_key=api_key)
+            with AIQuestionGenerator._client_lock:
+                if AIQuestionGenerator._client is None:
+                    api_key = os.getenv('OPENAI_API_KEY')
+                    if not api_key:
+                        raise ValueError("OPENAI_API_KEY environment variable is not set")
+                    AIQuestionGenerator._client = OpenAI(api_key=api_key)
         return AIQuestionGenerator._client
 
     @staticmethod
@@ -25,6 +25,8 @@ from prompts.math_question_prompts import get_question_generation_prompt, get_sy
 class StudentProfile:
     """Represents a student's profile and curriculum level."""
 
+    __slots__ = ('grade', 'level', 'sublevel')
+
     VALID_GRADES = [1, 2, 3]
     VALID_LEVELS = [1, 2, 3]
     VALID_SUBLEVELS = ["Starter", "Explorer", "Solver", "Champion"]
@@ -11,6 +11,7 @@ Uses curriculum_spec.py as the source of truth for curriculum data.
 
 import os
 import sys
+from functools import lru_cache
 from typing import Dict, Optional
 
 # Add parent directory to path for imports
@@ -65,10 +66,12 @@ class CurriculumHelper:
             return {}
 
     @staticmethod
+    @lru_cache(maxsize=64)
     def get_spec(grade: int, level: int, sublevel: str) -> Dict:
         """
         Get curriculum specification for a student profile.
         Retrieves from curriculum_spec.py as source of truth.
+        Results are cached per profile; treat the returned dict as read-only.
 
         Args:
             grade: 1, 2, or 3
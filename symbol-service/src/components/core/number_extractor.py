@@ -43,6 +43,27 @@ class NumberExtractor:
         'thousand': 1000,
     }
 
+    # One alternation over every number word (longest first) so a single
+    # regex pass finds all whole-word matches in the speech
+    _WORD_PATTERN = re.compile(
+        r'\b(' + '|'.join(sorted(map(re.escape, WORD_TO_NUMBER), key=len, reverse=True)) + r')\b'
+    )
+    # Position in WORD_TO_NUMBER; when several words match, the earliest entry wins
+    _WORD_PRIORITY = {word: index for index, word in enumerate(WORD_TO_NUMBER)}
+    _DIGIT_PATTERN = re.compile(r'\b(\d+)\b')
+    _PHONETIC_PATTERNS = tuple((re.compile(pattern), value) for pattern, value in (
+        (r'\bone\b', 1),
+        (r'\btwo\b|\btu\b', 2),
+        (r'\bthree\b|\btree\b', 3),
+        (r'\bfour\b|\bfor\b', 4),
+        (r'\bfive\b', 5),
+        (r'\bsix\b', 6),
+        (r'\bseven\b', 7),
+        (r'\beight\b|\bate\b', 8),
+        (r'\bnine\b', 9),
+        (r'\bten\b', 10),
+    ))
+
     @staticmethod
     def extract(speech: str) -> Optional[int]:
         """
@@ -92,12 +113,11 @@ class NumberExtractor:
         Returns:
             Number if found, None otherwise
         """
-        # Direct word match
-        for word, value in NumberExtractor.WORD_TO_NUMBER.items():
-            # Use word boundaries to match complete words
-            pattern = r'\b' + re.escape(word) + r'\b'
-            if re.search(pattern, speech):
-                return value
+        # Direct word match (word boundaries match complete words only)
+        matches = NumberExtractor._WORD_PATTERN.findall(speech)
+        if matches:
+            word = min(matches, key=NumberExtractor._WORD_PRIORITY.__getitem__)
+            return NumberExtractor.WORD_TO_NUMBER[word]
 
         return None
 
@@ -113,10 +133,10 @@ class NumberExtractor:
             Number if found, None otherwise
         """
         # Look for standalone digits or numbers
-        digit_matches = re.findall(r'\b(\d+)\b', speech)
-        if digit_matches:
+        digit_match = NumberExtractor._DIGIT_PATTERN.search(speech)
+        if digit_match:
             # Return the first number found
-            return int(digit_matches[0])
+            return int(digit_match.group(1))
 
         return None
 
@@ -132,21 +152,8 @@ class NumberExtractor:
             Number if found, None otherwise
         """
         # Handle special phonetic patterns
-        phonetic_patterns = {
-            r'\bone\b': 1,
-            r'\btwo\b|\btu\b': 2,
-            r'\bthree\b|\btree\b': 3,
-            r'\bfour\b|\bfor\b': 4,
-            r'\bfive\b': 5,
-            r'\bsix\b': 6,
-            r'\bseven\b': 7,
-            r'\beight\b|\bate\b': 8,
-            r'\bnine\b': 9,
-            r'\bten\b': 10,
-        }
-
-        for pattern, value in phonetic_patterns.items():
-            if re.search(pattern, speech):
+        for pattern, value in NumberExtractor._PHONETIC_PATTERNS:
+            if pattern.search(speech):
                 return value
 
         return None
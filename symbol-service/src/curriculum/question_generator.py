@@ -13,6 +13,8 @@ from .curriculum_spec import get_curriculum_spec, CURRICULUM
 class CurriculumQuestionGenerator:
     """Generate math questions based on curriculum specifications."""
 
+    __slots__ = ('grade', 'level', 'sublevel', 'spec', 'recent_questions', 'max_recent')
+
     def __init__(self, grade: str, level: int, sublevel: str):
         """
         Initialize with student profile.
@@ -43,17 +45,9 @@ class CurriculumQuestionGenerator:
         operations = self.spec.get('operations', ['+'])
         operation = random.choice(operations)
 
-        # Handle different operation types
-        if operation == '+':
-            return self._generate_addition()
-        elif operation == '-':
-            return self._generate_subtraction()
-        elif operation == '×':
-            return self._generate_multiplication()
-        elif operation == 'unknown_addend':
-            return self._generate_unknown_addend()
-        else:
-            return self._generate_addition()
+        # Unknown operation types fall back to addition
+        generator = self._GENERATORS.get(operation, CurriculumQuestionGenerator._generate_addition)
+        return generator(self)
 
     def _generate_addition(self) -> Dict:
         """Generate addition question within spec constraints."""
@@ -101,12 +95,10 @@ class CurriculumQuestionGenerator:
 
         # Subtraction: a - b = c, where c is answer
         b = random.randint(0, min(operand_max // 2, 10))
-        a = random.randint(b, operand_max)
+        # Bound a so the difference never exceeds result_max
+        a = random.randint(b, min(operand_max, b + result_max))
 
         answer = a - b
-        while answer > result_max:
-            a = random.randint(b, operand_max)
-            answer = a - b
 
         return {
             'question': f"{a} minus {b}",
@@ -123,27 +115,20 @@ class CurriculumQuestionGenerator:
         """Generate multiplication question within spec constraints."""
         spec = self.spec
 
+        product_max = spec.get('product_max', 100)
+
         if 'multiplicand_max' in spec:
             # Two-digit × one-digit
-            multiplicand = random.randint(10, spec.get('multiplicand_max', 20))
+            multiplicand_min, multiplicand_max = 10, spec.get('multiplicand_max', 20)
             multiplier = random.randint(2, spec.get('multiplier_max', 10))
         else:
             # Single digit × single digit
-            factors_max = spec.get('factors_max', 10)
-            factors_min = spec.get('factors_min', 2)
-            multiplicand = random.randint(factors_min, factors_max)
-            multiplier = random.randint(factors_min, factors_max)
+            multiplicand_min, multiplicand_max = spec.get('factors_min', 2), spec.get('factors_max', 10)
+            multiplier = random.randint(multiplicand_min, multiplicand_max)
 
+        # Bound the multiplicand so the product stays within product_max
+        multiplicand = random.randint(multiplicand_min, min(multiplicand_max, product_max // multiplier))
         answer = multiplicand * multiplier
-        product_max = spec.get('product_max', 100)
-
-        # Ensure within range
-        while answer > product_max:
-            if 'multiplicand_max' in spec:
-                multiplicand = random.randint(10, spec.get('multiplicand_max', 20))
-            else:
-                multiplicand = random.randint(spec.get('factors_min', 2), spec.get('factors_max', 10))
-            answer = multiplicand * multiplier
 
         return {
             'question': f"{multiplicand} times {multiplier}",
@@ -158,14 +143,13 @@ class CurriculumQuestionGenerator:
 
     def _generate_three_addend(self, addends_max: int, result_max: int) -> Dict:
         """Generate three-addend addition question."""
-        a = random.randint(2, addends_max)
-        b = random.randint(2, addends_max)
-        c = random.randint(1, addends_max)
+        # Bound each addend by what is left of result_max, so the remaining
+        # addends can still take their minimum values (b >= 2, c >= 1)
+        a = random.randint(2, min(addends_max, result_max - 3))
+        b = random.randint(2, min(addends_max, result_max - a - 1))
+        c = random.randint(1, min(addends_max, result_max - a - b))
 
         total = a + b + c
-        while total > result_max:
-            c = random.randint(1, addends_max)
-            total = a + b + c
 
         return {
             'question': f"{a} plus {b} plus {c}",
@@ -206,6 +190,14 @@ class CurriculumQuestionGenerator:
             'sublevel': self.sublevel
         }
 
+    # Question generator for each curriculum operation type
+    _GENERATORS = {
+        '+': _generate_addition,
+        '-': _generate_subtraction,
+        '×': _generate_multiplication,
+        'unknown_addend': _generate_unknown_addend,
+    }
+
     def validate_question(self, question: Dict) -> bool:
         """
         Validate question against curriculum spec.
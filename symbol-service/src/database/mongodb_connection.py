@@ -1,4 +1,5 @@
 import os
+import threading
 from typing import Optional
 from pymongo import MongoClient
 from pymongo.database import Database
@@ -15,6 +16,7 @@ class MongoDBConnection:
     _instance: Optional['MongoDBConnection'] = None
     _client: Optional[MongoClient] = None
     _database: Optional[Database] = None
+    _lock = threading.Lock()
 
     def __new__(cls) -> 'MongoDBConnection':
         if cls._instance is None:
@@ -38,31 +40,33 @@ class MongoDBConnection:
 
     def connect(self) -> bool:
         """Establish connection to MongoDB"""
-        try:
-            if self._client is None:
-                # Get connection details each time we connect
-                connection_string = self._get_connection_string()
-                database_name = self._get_database_name()
-
-                self._client = MongoClient(
-                    connection_string,
-                    serverSelectionTimeoutMS=5000,  # 5 second timeout
-                    connectTimeoutMS=5000,
-                    maxPoolSize=50,
-                    minPoolSize=5
-                )
-
-                # Test the connection
-                self._client.admin.command('ping')
-                self._database = self._client[database_name]
-                logger.info(f"Connected to MongoDB database: {database_name}")
-                return True
-
-        except (ConnectionFailure, ServerSelectionTimeoutError) as e:
-            logger.error(f"Failed to connect to MongoDB: {e}")
-            self._client = None
-            self._database = None
-            return False
+        # Serialize first connection so concurrent callers share one client
+        with self._lock:
+            try:
+                if self._client is None:
+                    # Get connection details each time we connect
+                    connection_string = self._get_connection_string()
+                    database_name = self._get_database_name()
+
+                    self._client = MongoClient(
+                        connection_string,
+                        serverSelectionTimeoutMS=5000,  # 5 second timeout
+                        connectTimeoutMS=5000,
+                        maxPoolSize=50,
+                        minPoolSize=5
+                    )
+
+                    # Test the connection
+                    self._client.admin.command('ping')
+                    self._database = self._client[database_name]
+                    logger.info(f"Connected to MongoDB database: {database_name}")
+                    return True
+
+            except (ConnectionFailure, ServerSelectionTimeoutError) as e:
+                logger.error(f"Failed to connect to MongoDB: {e}")
+                self._client = None
+                self._database = None
+                return False
 
         return True
 
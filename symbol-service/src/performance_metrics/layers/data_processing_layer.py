@@ -26,6 +26,13 @@ class DataProcessingLayer:
     - Binary feature patterns for K-Map classification
     """
 
+    # Performance zone indexed by [score_category][speed_category]
+    PERFORMANCE_ZONES = (
+        (0, 1, 1),  # Low score: low performance unless at least medium speed
+        (1, 2, 2),  # Medium score: proficient once speed is medium or fast
+        (1, 2, 3),  # High score: advanced only when also fast
+    )
+
     def __init__(self, grade_cohorts: Optional[Dict] = None):
         """
         Initialize data processing layer.
@@ -77,7 +84,7 @@ class DataProcessingLayer:
 
         # Outlier detection for time (3 standard deviations)
         if data['avg_time'] > 500:  # Reasonable upper bound
-            logger.warning(f"Unusual avg_time detected: {data['avg_time']}s")
+            logger.warning("Unusual avg_time detected: %ss", data['avg_time'])
 
         return True, None
 
@@ -97,13 +104,13 @@ class DataProcessingLayer:
         if 'avg_score' not in cleaned_data or pd.isna(cleaned_data['avg_score']):
             grade = cleaned_data.get('grade', 5)
             cleaned_data['avg_score'] = self._get_grade_median_score(grade)
-            logger.info(f"Imputed avg_score for grade {grade}")
+            logger.info("Imputed avg_score for grade %s", grade)
 
         # Impute missing time with grade-specific median
         if 'avg_time' not in cleaned_data or pd.isna(cleaned_data['avg_time']):
             grade = cleaned_data.get('grade', 5)
             cleaned_data['avg_time'] = self._get_grade_median_time(grade)
-            logger.info(f"Imputed avg_time for grade {grade}")
+            logger.info("Imputed avg_time for grade %s", grade)
 
         return cleaned_data
 
@@ -179,7 +186,7 @@ class DataProcessingLayer:
         binary_features = self._generate_binary_features(features)
         features.update(binary_features)
 
-        logger.debug(f"Generated {len(features)} features for user {data['user_id']}")
+        logger.debug("Generated %d features for user %s", len(features), data['user_id'])
 
         return features
 
@@ -245,14 +252,7 @@ class DataProcessingLayer:
         2: Proficient (good score or good speed)
         3: Advanced (high score and fast speed)
         """
-        if score_cat == 2 and speed_cat == 2:
-            return 3  # Advanced
-        elif score_cat >= 1 and speed_cat >= 1:
-            return 2  # Proficient
-        elif score_cat >= 1 or speed_cat >= 1:
-            return 1  # Developing
-        else:
-            return 0  # Low performance
+        return self.PERFORMANCE_ZONES[score_cat][speed_cat]
 
     def _generate_binary_features(self, features: Dict) -> Dict:
         """
@@ -312,7 +312,7 @@ class DataProcessingLayer:
         # Validate input
         is_valid, error = self.validate_input(data)
         if not is_valid:
-            logger.error(f"Validation failed: {error}")
+            logger.error("Validation failed: %s", error)
             return None, error
 
         # Impute missing values
@@ -321,5 +321,5 @@ class DataProcessingLayer:
         # Engineer features
         features = self.engineer_features(cleaned_data)
 
-        logger.info(f"Successfully processed data for user {data['user_id']}")
+        logger.info("Successfully processed data for user %s", data['user_id'])
         return features, None
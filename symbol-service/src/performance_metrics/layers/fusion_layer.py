@@ -23,6 +23,8 @@ class DecisionFusionLayer:
     - Validation and quality control
     """
 
+    __slots__ = ('level_labels', 'sublevel_labels')
+
     def __init__(self):
         """Initialize decision fusion layer."""
         self.level_labels = {1: "Level 1", 2: "Level 2", 3: "Level 3"}
@@ -78,7 +80,7 @@ class DecisionFusionLayer:
         # Calculate confidence based on max probability
         confidence = float(combined_proba[predicted_class])
 
-        logger.debug(f"Fused prediction: class={predicted_class}, confidence={confidence:.3f}")
+        logger.debug("Fused prediction: class=%d, confidence=%.3f", predicted_class, confidence)
 
         return predicted_class, combined_proba, confidence
 
@@ -120,7 +122,7 @@ class DecisionFusionLayer:
         else:
             confidence_level = "Low"
 
-        logger.debug(f"Confidence: {confidence_level} ({confidence_score:.3f})")
+        logger.debug("Confidence: %s (%.3f)", confidence_level, confidence_score)
 
         return confidence_level, confidence_score
 
@@ -171,7 +173,7 @@ class DecisionFusionLayer:
 
         sublevel_name = self.sublevel_labels[sublevel]
 
-        logger.debug(f"Sublevel prediction: {sublevel_name} ({confidence:.3f})")
+        logger.debug("Sublevel prediction: %s (%.3f)", sublevel_name, confidence)
 
         return sublevel, sublevel_name, confidence
 
@@ -217,7 +219,7 @@ class DecisionFusionLayer:
         warning_message = "; ".join(warnings) if warnings else None
 
         if warnings:
-            logger.warning(f"Validation warnings: {warning_message}")
+            logger.warning("Validation warnings: %s", warning_message)
 
         return is_valid, warning_message
 
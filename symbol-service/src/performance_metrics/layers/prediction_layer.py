@@ -5,7 +5,7 @@ Coordinates multiple machine learning models for ensemble predictions.
 """
 
 import numpy as np
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple, Union
 import logging
 
 from ..models.xgboost_model import XGBoostClassifier
@@ -31,6 +31,37 @@ class MultiModelPredictionLayer:
     - K-Map: Rule-based engine for binary patterns
     """
 
+    # Ensemble weights per confidence scenario (shared, treat as read-only)
+    MODEL_WEIGHTS = {
+        # Favor tree-based models for high confidence
+        'high_confidence': {
+            'xgboost': 0.25,
+            'random_forest': 0.20,
+            'neural_network': 0.15,
+            'svm': 0.15,
+            'lightgbm': 0.20,
+            'kmap': 0.05
+        },
+        # Balanced weights for exploration
+        'exploratory': {
+            'xgboost': 0.18,
+            'random_forest': 0.18,
+            'neural_network': 0.16,
+            'svm': 0.16,
+            'lightgbm': 0.18,
+            'kmap': 0.14
+        },
+        # Default weights
+        'default': {
+            'xgboost': 0.22,
+            'random_forest': 0.18,
+            'neural_network': 0.16,
+            'svm': 0.16,
+            'lightgbm': 0.20,
+            'kmap': 0.08
+        }
+    }
+
     def __init__(self, grade: Optional[int] = None):
         """
         Initialize prediction layer with all models.
@@ -117,13 +148,14 @@ class MultiModelPredictionLayer:
         logger.info("All models trained successfully")
 
     def predict_ensemble(self, X: np.ndarray,
-                        binary_pattern: Optional[str] = None) -> Dict[str, np.ndarray]:
+                        binary_pattern: Optional[Union[str, List[str]]] = None) -> Dict[str, np.ndarray]:
         """
         Get predictions from all models.
 
         Args:
             X: Feature matrix for prediction
-            binary_pattern: Binary pattern for K-Map prediction
+            binary_pattern: Binary pattern for K-Map prediction, or one pattern
+                per row of X for batch prediction
 
         Returns:
             Dictionary mapping model names to prediction probabilities
@@ -146,7 +178,8 @@ class MultiModelPredictionLayer:
         if binary_pattern and self.kmap.is_trained:
             try:
                 num_classes = 3  # Default: levels 1, 2, 3
-                predictions['kmap'] = self.kmap.predict_proba([binary_pattern], num_classes)
+                patterns = [binary_pattern] if isinstance(binary_pattern, str) else binary_pattern
+                predictions['kmap'] = self.kmap.predict_proba(patterns, num_classes)
             except Exception as e:
                 logger.warning(f"K-Map prediction failed: {e}")
 
@@ -162,36 +195,7 @@ class MultiModelPredictionLayer:
         Returns:
             Dictionary mapping model names to weights
         """
-        if confidence_scenario == 'high_confidence':
-            # Favor tree-based models for high confidence
-            return {
-                'xgboost': 0.25,
-                'random_forest': 0.20,
-                'neural_network': 0.15,
-                'svm': 0.15,
-                'lightgbm': 0.20,
-                'kmap': 0.05
-            }
-        elif confidence_scenario == 'exploratory':
-            # Balanced weights for exploration
-            return {
-                'xgboost': 0.18,
-                'random_forest': 0.18,
-                'neural_network': 0.16,
-                'svm': 0.16,
-                'lightgbm': 0.18,
-                'kmap': 0.14
-            }
-        else:
-            # Default weights
-            return {
-                'xgboost': 0.22,
-                'random_forest': 0.18,
-                'neural_network': 0.16,
-                'svm': 0.16,
-                'lightgbm': 0.20,
-                'kmap': 0.08
-            }
+        return self.MODEL_WEIGHTS.get(confidence_scenario, self.MODEL_WEIGHTS['default'])
 
     def save_all_models(self, base_path: str):
         """Save all trained models to disk."""
@@ -136,7 +136,7 @@ class XGBoostClassifier(BasePerformanceModel):
         if self.model is not None:
             importance_dict = self.model.get_booster().get_score(importance_type='gain')
             self.feature_importance = importance_dict
-            logger.debug(f"Feature importance extracted: {len(importance_dict)} features")
+            logger.debug("Feature importance extracted: %d features", len(importance_dict))
 
     def save_model(self, path: str):
         """